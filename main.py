@@ -25,7 +25,7 @@ def main():
         print(f"Parsed {len(transactions)} transactions")
 
         # 3. Validate & filter (UNPACK PROPERLY)
-        valid_transactions, invalid_count, summary = validate_and_filter(transactions)
+        valid_transactions, invalid_count, summary = validate_and_filter(transactions, verbose=True)
         print(f"Validation Summary: {summary}")
 
         # 4. Fetch API products
@@ -60,11 +60,11 @@ def enrich_sales_data(transactions, product_mapping):
     enriched_transactions = []
 
     for tx in transactions:
-        enriched_tx = tx.copy()
+        enriched_tx = tx.to_dict()
 
         try:
             # Extract numeric ID from ProductID (P101 -> 101)
-            product_id = int(tx["ProductID"][1:])
+            product_id = int(tx.product_id[1:])
 
             if product_id in product_mapping:
                 api_product = product_mapping[product_id]
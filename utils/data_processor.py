@@ -1,102 +1,183 @@
-def parse_transactions(raw_lines):
-    """
-    Parses raw lines into clean list of dictionaries
+import gc
+import heapq
+import sys
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import NamedTuple
 
-    Returns: list of dictionaries with keys:
-    ['TransactionID', 'Date', 'ProductID', 'ProductName',
-     'Quantity', 'UnitPrice', 'CustomerID', 'Region']
+
+class Transaction(NamedTuple):
     """
+    A single parsed sales transaction
 
-    cleaned_transactions = []
+    amount is quantity * unit_price, computed once at parse time
+    """
 
-    for line in raw_lines:
-        parts = line.split("|")
-
-        # Skip rows with incorrect number of fields
-        if len(parts) != 8:
-            continue
-
-        transaction_id, date, product_id, product_name, quantity, unit_price, customer_id, region = parts
-
-        # Handle commas in ProductName
-        product_name = product_name.replace(",", "")
-
-        # Handle commas in numeric fields and convert types
-        try:
-            quantity = int(quantity)
-            unit_price = float(unit_price.replace(",", ""))
-        except ValueError:
-            continue
-
-        transaction = {
-            "TransactionID": transaction_id,
-            "Date": date,
-            "ProductID": product_id,
-            "ProductName": product_name,
-            "Quantity": quantity,
-            "UnitPrice": unit_price,
-            "CustomerID": customer_id,
-            "Region": region
+    transaction_id: str
+    date: str
+    product_id: str
+    product_name: str
+    quantity: int
+    unit_price: float
+    customer_id: str
+    region: str
+    amount: float
+
+    def to_dict(self):
+        """
+        Returns the transaction as a dictionary keyed by the
+        sales file's column names
+        """
+
+        return {
+            "TransactionID": self.transaction_id,
+            "Date": self.date,
+            "ProductID": self.product_id,
+            "ProductName": self.product_name,
+            "Quantity": self.quantity,
+            "UnitPrice": self.unit_price,
+            "CustomerID": self.customer_id,
+            "Region": self.region,
+            "Amount": self.amount
         }
 
-        cleaned_transactions.append(transaction)
+
+def parse_transactions(raw_lines):
+    """
+    Parses raw lines into clean list of transactions
+
+    Returns: list of Transaction tuples; amount is
+    quantity * unit_price, computed once here so the analytics
+    functions don't have to recompute it per row
+    """
+
+    cleaned_transactions = []
+    append = cleaned_transactions.append
+
+    # Build rows through tuple.__new__ directly; Transaction(...) would go
+    # through the Python-level __new__ that NamedTuple generates
+    new_transaction = tuple.__new__
+
+    # Prices repeat across rows (usually one per product), so each
+    # distinct raw price string is converted to float only once
+    prices = {}
+
+    # Every row is a new GC-tracked tuple, so collections triggered while
+    # building the list would rescan the whole list; pause the collector
+    # for the bulk build
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for line in raw_lines:
+            parts = line.split("|")
+
+            # Skip rows with incorrect number of fields
+            if len(parts) != 8:
+                continue
+
+            transaction_id, date, product_id, product_name, quantity, unit_price, customer_id, region = parts
+
+            # Handle commas in ProductName (most names have none, so only
+            # rebuild the string when there is one)
+            if "," in product_name:
+                product_name = product_name.replace(",", "")
+
+            # Handle commas in numeric fields and convert types
+            try:
+                quantity = int(quantity)
+                price = prices.get(unit_price)
+                if price is None:
+                    price = prices[unit_price] = float(unit_price.replace(",", ""))
+                unit_price = price
+            except ValueError:
+                continue
+
+            # Low-cardinality fields repeat across many rows; interning keeps
+            # one string object per distinct value, so the group-by dicts and
+            # unique-customer sets compare keys by identity
+            customer_id = sys.intern(customer_id)
+            region = sys.intern(region)
+            date = sys.intern(date)
+            product_name = sys.intern(product_name)
+
+            transaction = new_transaction(Transaction, (
+                transaction_id,
+                date,
+                product_id,
+                product_name,
+                quantity,
+                unit_price,
+                customer_id,
+                region,
+                quantity * unit_price
+            ))
+
+            append(transaction)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
     return cleaned_transactions
 
 
-def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
+def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None,
+                        verbose=False):
     """
     Validates transactions and applies optional filters
-    """
 
-    valid_transactions = []
-    invalid_count = 0
+    With verbose=True the available regions and amount range are printed
+    first
+    """
 
     total_input = len(transactions)
-    filtered_by_region = 0
-    filtered_by_amount = 0
 
-    # collect available regions and amount range
-    regions = set()
-    amounts = []
+    if verbose and transactions:
+        # collect available regions and amount range
+        regions = set()
+        amount_min = amount_max = transactions[0].amount
 
-    for tx in transactions:
-        regions.add(tx.get("Region"))
-        amounts.append(tx.get("Quantity", 0) * tx.get("UnitPrice", 0))
+        for tx in transactions:
+            regions.add(tx.region)
+            amount = tx.amount
+            if amount < amount_min:
+                amount_min = amount
+            elif amount > amount_max:
+                amount_max = amount
 
-    if regions:
         print("Available regions:", sorted(regions))
-    if amounts:
-        print("Transaction amount range:", min(amounts), "to", max(amounts))
+        print("Transaction amount range:", amount_min, "to", amount_max)
+
+    # Validation rules
+    valid_transactions = [
+        tx for tx in transactions
+        if not (
+            tx.quantity <= 0 or
+            tx.unit_price <= 0 or
+            tx.transaction_id[:1] != "T" or
+            tx.product_id[:1] != "P" or
+            tx.customer_id[:1] != "C"
+        )
+    ]
+    invalid_count = len(transactions) - len(valid_transactions)
 
-    for tx in transactions:
-        # Validation rules
-        if (
-            tx.get("Quantity", 0) <= 0 or
-            tx.get("UnitPrice", 0) <= 0 or
-            not tx.get("TransactionID", "").startswith("T") or
-            not tx.get("ProductID", "").startswith("P") or
-            not tx.get("CustomerID", "").startswith("C")
-        ):
-            invalid_count += 1
-            continue
-
-        amount = tx["Quantity"] * tx["UnitPrice"]
-
-        # Filter by region
-        if region and tx["Region"] != region:
-            filtered_by_region += 1
-            continue
-
-        # Filter by amount
-        if min_amount and amount < min_amount:
-            filtered_by_amount += 1
-            continue
-        if max_amount and amount > max_amount:
-            filtered_by_amount += 1
-            continue
-
-        valid_transactions.append(tx)
+    # Each optional filter is its own pass that only runs when the filter
+    # is set, so unused filters cost nothing per row
+    filtered_by_region = 0
+    if region:
+        kept = [tx for tx in valid_transactions if tx.region == region]
+        filtered_by_region = len(valid_transactions) - len(kept)
+        valid_transactions = kept
+
+    filtered_by_amount = 0
+    if min_amount:
+        kept = [tx for tx in valid_transactions if not tx.amount < min_amount]
+        filtered_by_amount += len(valid_transactions) - len(kept)
+        valid_transactions = kept
+    if max_amount:
+        kept = [tx for tx in valid_transactions if not tx.amount > max_amount]
+        filtered_by_amount += len(valid_transactions) - len(kept)
+        valid_transactions = kept
 
     filter_summary = {
         "total_input": total_input,
@@ -109,19 +190,92 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     return valid_transactions, invalid_count, filter_summary
 
 
-def calculate_total_revenue(transactions):
+def _group_totals(transactions, key, distinct=None):
     """
-    Calculates total revenue from all transactions
+    Aggregates quantity, revenue and transaction count per value of
+    the given field in a single pass
 
-    Returns: float (total revenue)
+    If distinct names another field, each group also collects the set
+    of values seen in that field under "distinct"
+
+    Returns: dictionary mapping field value to
+    {"quantity": int, "revenue": float, "count": int}
     """
 
-    total_revenue = 0.0
+    get_key = attrgetter(key)
+    get_distinct = attrgetter(distinct) if distinct is not None else None
+
+    # Each distinct value gets an integer code on first sight; totals are
+    # kept in parallel lists indexed by that code
+    codes = {}
+    quantities = []
+    revenues = []
+    counts = []
+    seen = []
 
     for tx in transactions:
-        total_revenue += tx["Quantity"] * tx["UnitPrice"]
+        name = get_key(tx)
+
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(counts)
+            quantities.append(0)
+            revenues.append(0.0)
+            counts.append(0)
+            if distinct is not None:
+                seen.append(set())
+
+        quantities[code] += tx.quantity
+        revenues[code] += tx.amount
+        counts[code] += 1
+        if distinct is not None:
+            seen[code].add(get_distinct(tx))
+
+    groups = {
+        name: {
+            "quantity": quantities[code],
+            "revenue": revenues[code],
+            "count": counts[code]
+        }
+        for name, code in codes.items()
+    }
+
+    if distinct is not None:
+        for name, code in codes.items():
+            groups[name]["distinct"] = seen[code]
+
+    return groups
 
-    return total_revenue
+
+def summarize_products(transactions):
+    """
+    Builds per-product totals
+
+    The result can be passed as product_summary to
+    top_selling_products, low_performing_products and
+    high_performing_products so the transactions are aggregated once
+    for all three
+
+    Returns: list of tuples
+    (ProductName, TotalQuantity, TotalRevenue)
+    """
+
+    return [
+        (product,
+         data["quantity"],
+         round(data["revenue"], 2))
+        for product, data in _group_totals(transactions, "product_name").items()
+    ]
+
+
+def calculate_total_revenue(transactions):
+    """
+    Calculates total revenue from all transactions
+
+    Returns: float (total revenue)
+    """
+
+    return sum((tx.amount for tx in transactions), 0.0)
 
 
 def region_wise_sales(transactions):
@@ -131,44 +285,29 @@ def region_wise_sales(transactions):
     Returns: dictionary with region statistics
     """
 
-    region_stats = {}
-    total_sales_all = 0.0
+    region_totals = _group_totals(transactions, "region")
+    total_sales_all = sum(data["revenue"] for data in region_totals.values())
 
-    # First pass: calculate total sales per region
-    for tx in transactions:
-        region = tx["Region"]
-        sale_amount = tx["Quantity"] * tx["UnitPrice"]
-        total_sales_all += sale_amount
-
-        if region not in region_stats:
-            region_stats[region] = {
-                "total_sales": 0.0,
-                "transaction_count": 0
-            }
-
-        region_stats[region]["total_sales"] += sale_amount
-        region_stats[region]["transaction_count"] += 1
-
-    # Second pass: calculate percentage of total sales
-    for region in region_stats:
-        region_stats[region]["percentage"] = round(
-            (region_stats[region]["total_sales"] / total_sales_all) * 100, 2
-        )
+    region_stats = {
+        region: {
+            "total_sales": data["revenue"],
+            "transaction_count": data["count"],
+            "percentage": round((data["revenue"] / total_sales_all) * 100, 2)
+        }
+        for region, data in region_totals.items()
+    }
 
     # Sort regions by total_sales descending
-    sorted_regions = dict(
-        sorted(
-            region_stats.items(),
-            key=lambda item: item[1]["total_sales"],
-            reverse=True
-        )
-    )
+    order = [(region, stats["total_sales"]) for region, stats in region_stats.items()]
+    order.sort(key=itemgetter(1), reverse=True)
+
+    sorted_regions = {region: region_stats[region] for region, _ in order}
 
     return sorted_regions
 
 
 
-def top_selling_products(transactions, n=5):
+def top_selling_products(transactions, n=5, product_summary=None):
     """
     Finds top n products by total quantity sold
 
@@ -176,36 +315,12 @@ def top_selling_products(transactions, n=5):
     (ProductName, TotalQuantity, TotalRevenue)
     """
 
-    product_summary = {}
-
-    # Aggregate by ProductName
-    for tx in transactions:
-        product = tx["ProductName"]
-        quantity = tx["Quantity"]
-        revenue = quantity * tx["UnitPrice"]
-
-        if product not in product_summary:
-            product_summary[product] = {
-                "total_quantity": 0,
-                "total_revenue": 0.0
-            }
-
-        product_summary[product]["total_quantity"] += quantity
-        product_summary[product]["total_revenue"] += revenue
-
-    # Convert to list of tuples
-    product_list = [
-        (product,
-         data["total_quantity"],
-         round(data["total_revenue"], 2))
-        for product, data in product_summary.items()
-    ]
-
-    # Sort by total quantity descending
-    product_list.sort(key=lambda x: x[1], reverse=True)
+    if product_summary is None:
+        product_summary = summarize_products(transactions)
 
-    # Return top n products
-    return product_list[:n]
+    # Top n by total quantity, descending; a bounded heap avoids
+    # sorting every product
+    return heapq.nlargest(n, product_summary, key=itemgetter(1))
 
 
 
@@ -216,45 +331,23 @@ def customer_analysis(transactions):
     Returns: dictionary of customer statistics
     """
 
-    customer_stats = {}
-
-    # Aggregate data per customer
-    for tx in transactions:
-        customer_id = tx["CustomerID"]
-        product = tx["ProductName"]
-        amount = tx["Quantity"] * tx["UnitPrice"]
-
-        if customer_id not in customer_stats:
-            customer_stats[customer_id] = {
-                "total_spent": 0.0,
-                "purchase_count": 0,
-                "products_bought": set()
-            }
-
-        customer_stats[customer_id]["total_spent"] += amount
-        customer_stats[customer_id]["purchase_count"] += 1
-        customer_stats[customer_id]["products_bought"].add(product)
-
-    # Calculate average order value
-    for customer_id in customer_stats:
-        total = customer_stats[customer_id]["total_spent"]
-        count = customer_stats[customer_id]["purchase_count"]
-
-        customer_stats[customer_id]["avg_order_value"] = round(total / count, 2)
-
-        # Convert set to list for output
-        customer_stats[customer_id]["products_bought"] = list(
-            customer_stats[customer_id]["products_bought"]
-        )
+    customer_stats = {
+        customer_id: {
+            "total_spent": data["revenue"],
+            "purchase_count": data["count"],
+            "products_bought": list(data["distinct"]),
+            "avg_order_value": round(data["revenue"] / data["count"], 2)
+        }
+        for customer_id, data in _group_totals(
+            transactions, "customer_id", distinct="product_name"
+        ).items()
+    }
 
     # Sort customers by total_spent descending
-    sorted_customers = dict(
-        sorted(
-            customer_stats.items(),
-            key=lambda item: item[1]["total_spent"],
-            reverse=True
-        )
-    )
+    order = [(cid, stats["total_spent"]) for cid, stats in customer_stats.items()]
+    order.sort(key=itemgetter(1), reverse=True)
+
+    sorted_customers = {cid: customer_stats[cid] for cid, _ in order}
 
     return sorted_customers
 
@@ -266,27 +359,16 @@ def daily_sales_trend(transactions):
     Returns: dictionary sorted by date
     """
 
-    daily_stats = {}
-
-    for tx in transactions:
-        date = tx["Date"]
-        amount = tx["Quantity"] * tx["UnitPrice"]
-
-        if date not in daily_stats:
-            daily_stats[date] = {
-                "revenue": 0.0,
-                "transaction_count": 0,
-                "customers": set()
-            }
-
-        daily_stats[date]["revenue"] += amount
-        daily_stats[date]["transaction_count"] += 1
-        daily_stats[date]["customers"].add(tx["CustomerID"])
-
-    # Convert customer sets to counts
-    for date in daily_stats:
-        daily_stats[date]["unique_customers"] = len(daily_stats[date]["customers"])
-        del daily_stats[date]["customers"]
+    daily_stats = {
+        date: {
+            "revenue": data["revenue"],
+            "transaction_count": data["count"],
+            "unique_customers": len(data["distinct"])
+        }
+        for date, data in _group_totals(
+            transactions, "date", distinct="customer_id"
+        ).items()
+    }
 
     # Sort chronologically by date
     sorted_daily_stats = dict(sorted(daily_stats.items()))
@@ -301,35 +383,20 @@ def find_peak_sales_day(transactions):
     Returns: tuple (date, revenue, transaction_count)
     """
 
-    daily_revenue = {}
-
-    for tx in transactions:
-        date = tx["Date"]
-        amount = tx["Quantity"] * tx["UnitPrice"]
-
-        if date not in daily_revenue:
-            daily_revenue[date] = {
-                "revenue": 0.0,
-                "transaction_count": 0
-            }
-
-        daily_revenue[date]["revenue"] += amount
-        daily_revenue[date]["transaction_count"] += 1
-
     peak_date = None
     peak_revenue = 0.0
     peak_count = 0
 
-    for date, stats in daily_revenue.items():
+    for date, stats in _group_totals(transactions, "date").items():
         if stats["revenue"] > peak_revenue:
             peak_revenue = stats["revenue"]
-            peak_count = stats["transaction_count"]
+            peak_count = stats["count"]
             peak_date = date
 
     return peak_date, peak_revenue, peak_count
 
 
-def low_performing_products(transactions, threshold=10):
+def low_performing_products(transactions, threshold=10, product_summary=None):
     """
     Identifies products with low sales
 
@@ -337,40 +404,23 @@ def low_performing_products(transactions, threshold=10):
     (ProductName, TotalQuantity, TotalRevenue)
     """
 
-    product_summary = {}
-
-    # Aggregate data by product
-    for tx in transactions:
-        product = tx["ProductName"]
-        quantity = tx["Quantity"]
-        revenue = quantity * tx["UnitPrice"]
-
-        if product not in product_summary:
-            product_summary[product] = {
-                "total_quantity": 0,
-                "total_revenue": 0.0
-            }
-
-        product_summary[product]["total_quantity"] += quantity
-        product_summary[product]["total_revenue"] += revenue
+    if product_summary is None:
+        product_summary = summarize_products(transactions)
 
     # Filter products below threshold
     low_products = [
-        (product,
-         data["total_quantity"],
-         round(data["total_revenue"], 2))
-        for product, data in product_summary.items()
-        if data["total_quantity"] < threshold
+        product for product in product_summary
+        if product[1] < threshold
     ]
 
     # Sort by TotalQuantity ascending
-    low_products.sort(key=lambda x: x[1])
+    low_products.sort(key=itemgetter(1))
 
     return low_products
 
 
 
-def high_performing_products(transactions, threshold=50):
+def high_performing_products(transactions, threshold=50, product_summary=None):
     """
     Identifies products with high sales performance
 
@@ -378,268 +428,176 @@ def high_performing_products(transactions, threshold=50):
     (ProductName, TotalQuantity, TotalRevenue)
     """
 
-    product_summary = {}
-
-    for tx in transactions:
-        product = tx["ProductName"]
-        quantity = tx["Quantity"]
-        revenue = quantity * tx["UnitPrice"]
-
-        if product not in product_summary:
-            product_summary[product] = {
-                "total_quantity": 0,
-                "total_revenue": 0.0
-            }
-
-        product_summary[product]["total_quantity"] += quantity
-        product_summary[product]["total_revenue"] += revenue
+    if product_summary is None:
+        product_summary = summarize_products(transactions)
 
     high_products = [
-        (product,
-         data["total_quantity"],
-         round(data["total_revenue"], 2))
-        for product, data in product_summary.items()
-        if data["total_quantity"] >= threshold
+        product for product in product_summary
+        if product[1] >= threshold
     ]
 
     # Sort by quantity descending
-    high_products.sort(key=lambda x: x[1], reverse=True)
+    high_products.sort(key=itemgetter(1), reverse=True)
 
     return high_products
 
 
-
-from datetime import datetime
-from collections import defaultdict
-
-
-def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
-    """
-    Generates a comprehensive sales analytics text report
+def _report_summary(transactions):
     """
+    Aggregates everything the sales report needs in a single pass
 
-    with open(output_file, "w", encoding="utf-8") as file:
-
-        # ---------------- HEADER ----------------
-        file.write("SALES ANALYTICS REPORT\n")
-        file.write("=" * 50 + "\n")
-        file.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        file.write(f"Records Processed: {len(transactions)}\n\n")
-
-        # ---------------- OVERALL SUMMARY ----------------
-        total_revenue = sum(tx["Quantity"] * tx["UnitPrice"] for tx in transactions)
-        avg_order_value = total_revenue / len(transactions) if transactions else 0
-        dates = sorted(tx["Date"] for tx in transactions)
-
-        file.write("OVERALL SUMMARY\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Total Revenue: {total_revenue:,.2f}\n")
-        file.write(f"Total Transactions: {len(transactions)}\n")
-        file.write(f"Average Order Value: {avg_order_value:,.2f}\n")
-        if dates:
-            file.write(f"Date Range: {dates[0]} to {dates[-1]}\n\n")
-
-        # ---------------- REGION-WISE PERFORMANCE ----------------
-        region_stats = defaultdict(lambda: {"sales": 0, "count": 0})
-
-        for tx in transactions:
-            amount = tx["Quantity"] * tx["UnitPrice"]
-            region_stats[tx["Region"]]["sales"] += amount
-            region_stats[tx["Region"]]["count"] += 1
-
-        file.write("REGION-WISE PERFORMANCE\n")
-        file.write("-" * 50 + "\n")
-        for region, stats in sorted(region_stats.items(), key=lambda x: x[1]["sales"], reverse=True):
-            percent = (stats["sales"] / total_revenue) * 100 if total_revenue else 0
-            file.write(
-                f"{region}: Sales={stats['sales']:,.2f}, "
-                f"% of Total={percent:.2f}%, "
-                f"Transactions={stats['count']}\n"
-            )
-        file.write("\n")
-
-        # ---------------- TOP PRODUCTS ----------------
-        product_summary = defaultdict(lambda: {"qty": 0, "rev": 0})
-
-        for tx in transactions:
-            product_summary[tx["ProductName"]]["qty"] += tx["Quantity"]
-            product_summary[tx["ProductName"]]["rev"] += tx["Quantity"] * tx["UnitPrice"]
-
-        file.write("TOP PRODUCTS\n")
-        file.write("-" * 50 + "\n")
-        for i, (product, stats) in enumerate(
-            sorted(product_summary.items(), key=lambda x: x[1]["qty"], reverse=True)[:5], start=1
-        ):
-            file.write(
-                f"{i}. {product} | Quantity={stats['qty']} | Revenue={stats['rev']:,.2f}\n"
-            )
-        file.write("\n")
-
-        # ---------------- TOP CUSTOMERS ----------------
-        customer_summary = defaultdict(lambda: {"spent": 0, "orders": 0})
-
-        for tx in transactions:
-            customer_summary[tx["CustomerID"]]["spent"] += tx["Quantity"] * tx["UnitPrice"]
-            customer_summary[tx["CustomerID"]]["orders"] += 1
-
-        file.write("TOP CUSTOMERS\n")
-        file.write("-" * 50 + "\n")
-        for i, (cust, stats) in enumerate(
-            sorted(customer_summary.items(), key=lambda x: x[1]["spent"], reverse=True)[:5], start=1
-        ):
-            avg = stats["spent"] / stats["orders"]
-            file.write(
-                f"{i}. {cust} | Total Spent={stats['spent']:,.2f} | Avg Order={avg:,.2f}\n"
-            )
-        file.write("\n")
-
-        # ---------------- DAILY SALES TREND ----------------
-        daily_stats = defaultdict(lambda: {"rev": 0, "count": 0, "customers": set()})
-
-        for tx in transactions:
-            daily_stats[tx["Date"]]["rev"] += tx["Quantity"] * tx["UnitPrice"]
-            daily_stats[tx["Date"]]["count"] += 1
-            daily_stats[tx["Date"]]["customers"].add(tx["CustomerID"])
-
-        file.write("DAILY SALES TREND\n")
-        file.write("-" * 50 + "\n")
-        for date in sorted(daily_stats):
-            file.write(
-                f"{date}: Revenue={daily_stats[date]['rev']:,.2f}, "
-                f"Transactions={daily_stats[date]['count']}, "
-                f"Unique Customers={len(daily_stats[date]['customers'])}\n"
-            )
-        file.write("\n")
-
-        # ---------------- API ENRICHMENT SUMMARY ----------------
-        enriched = sum(1 for tx in enriched_transactions if tx.get("API_Match"))
-        not_enriched = len(enriched_transactions) - enriched
+    Returns: dictionary with total_revenue, first_date, last_date and
+    per-region, per-product, per-customer and per-day dictionaries
+    """
 
-        file.write("API ENRICHMENT SUMMARY\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Total Records Enriched: {enriched}\n")
-        file.write(f"Records Not Enriched: {not_enriched}\n")
+    total_revenue = 0
+    first_date = last_date = None
 
-    print(f"✅ Sales report generated at {output_file}")
+    region_revenue = {}
+    region_count = {}
+    product_quantity = {}
+    product_revenue = {}
+    customer_spent = {}
+    customer_orders = {}
+    daily_revenue = {}
+    daily_count = {}
+    daily_customers = {}
 
+    for tx in transactions:
+        q, amount, r, d, c, pn = (
+            tx.quantity, tx.amount, tx.region,
+            tx.date, tx.customer_id, tx.product_name
+        )
 
+        total_revenue += amount
+        if first_date is None or d < first_date:
+            first_date = d
+        if last_date is None or d > last_date:
+            last_date = d
+
+        region_revenue[r] = region_revenue.get(r, 0) + amount
+        region_count[r] = region_count.get(r, 0) + 1
+
+        product_quantity[pn] = product_quantity.get(pn, 0) + q
+        product_revenue[pn] = product_revenue.get(pn, 0) + amount
+
+        customer_spent[c] = customer_spent.get(c, 0) + amount
+        customer_orders[c] = customer_orders.get(c, 0) + 1
+
+        daily_revenue[d] = daily_revenue.get(d, 0) + amount
+        daily_count[d] = daily_count.get(d, 0) + 1
+        customers = daily_customers.get(d)
+        if customers is None:
+            customers = daily_customers[d] = set()
+        customers.add(c)
+
+    return {
+        "total_revenue": total_revenue,
+        "first_date": first_date,
+        "last_date": last_date,
+        "region_revenue": region_revenue,
+        "region_count": region_count,
+        "product_quantity": product_quantity,
+        "product_revenue": product_revenue,
+        "customer_spent": customer_spent,
+        "customer_orders": customer_orders,
+        "daily_revenue": daily_revenue,
+        "daily_count": daily_count,
+        "daily_customers": daily_customers
+    }
 
-from datetime import datetime
-from collections import defaultdict
 
 def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
     """
     Generates a comprehensive formatted text report and saves it to a file
     """
 
+    summary = _report_summary(transactions)
+    total_revenue = summary["total_revenue"]
+    region_revenue = summary["region_revenue"]
+    region_count = summary["region_count"]
+    product_quantity = summary["product_quantity"]
+    customer_orders = summary["customer_orders"]
+    daily_revenue = summary["daily_revenue"]
+    daily_count = summary["daily_count"]
+    daily_customers = summary["daily_customers"]
+
     # ---------- BASIC METRICS ----------
     total_transactions = len(transactions)
-    total_revenue = sum(tx["Quantity"] * tx["UnitPrice"] for tx in transactions)
+    first_date = summary["first_date"]
+    last_date = summary["last_date"]
     avg_order_value = total_revenue / total_transactions if total_transactions else 0
-
-    dates = [tx["Date"] for tx in transactions]
-    date_range = f"{min(dates)} to {max(dates)}" if dates else "N/A"
-
-    # ---------- REGION PERFORMANCE ----------
-    region_stats = defaultdict(lambda: {"revenue": 0, "count": 0})
-    for tx in transactions:
-        amount = tx["Quantity"] * tx["UnitPrice"]
-        region_stats[tx["Region"]]["revenue"] += amount
-        region_stats[tx["Region"]]["count"] += 1
+    date_range = f"{first_date} to {last_date}" if first_date is not None else "N/A"
 
     # ---------- TOP PRODUCTS ----------
-    product_stats = defaultdict(lambda: {"qty": 0, "revenue": 0})
-    for tx in transactions:
-        product = tx["ProductName"]
-        qty = tx["Quantity"]
-        amount = qty * tx["UnitPrice"]
-        product_stats[product]["qty"] += qty
-        product_stats[product]["revenue"] += amount
-
-    top_products = sorted(
-        product_stats.items(),
-        key=lambda x: x[1]["revenue"],
-        reverse=True
-    )[:5]
+    top_products = heapq.nlargest(
+        5, summary["product_revenue"].items(), key=itemgetter(1)
+    )
 
     # ---------- TOP CUSTOMERS ----------
-    customer_stats = defaultdict(lambda: {"spent": 0, "orders": 0})
-    for tx in transactions:
-        cid = tx["CustomerID"]
-        amount = tx["Quantity"] * tx["UnitPrice"]
-        customer_stats[cid]["spent"] += amount
-        customer_stats[cid]["orders"] += 1
-
-    top_customers = sorted(
-        customer_stats.items(),
-        key=lambda x: x[1]["spent"],
-        reverse=True
-    )[:5]
-
-    # ---------- DAILY SALES ----------
-    daily_stats = defaultdict(lambda: {"revenue": 0, "count": 0, "customers": set()})
-    for tx in transactions:
-        date = tx["Date"]
-        amount = tx["Quantity"] * tx["UnitPrice"]
-        daily_stats[date]["revenue"] += amount
-        daily_stats[date]["count"] += 1
-        daily_stats[date]["customers"].add(tx["CustomerID"])
+    top_customers = heapq.nlargest(
+        5, summary["customer_spent"].items(), key=itemgetter(1)
+    )
 
     # ---------- API ENRICHMENT ----------
     enriched_count = sum(1 for tx in enriched_transactions if tx.get("API_Match") is True)
     unenriched = [tx["TransactionID"] for tx in enriched_transactions if not tx.get("API_Match")]
 
+    # ---------- BUILD REPORT ----------
+    # Lines are collected in memory and written with a single call
+    buf = []
+    w = buf.append
+
+    w("SALES ANALYTICS REPORT\n")
+    w("=" * 60 + "\n")
+    w(f"Generated on: {datetime.now()}\n")
+    w(f"Records Processed: {total_transactions}\n\n")
+
+    w("OVERALL SUMMARY\n")
+    w("-" * 60 + "\n")
+    w(f"Total Revenue: {total_revenue:,.2f}\n")
+    w(f"Total Transactions: {total_transactions}\n")
+    w(f"Average Order Value: {avg_order_value:,.2f}\n")
+    w(f"Date Range: {date_range}\n\n")
+
+    w("REGION-WISE PERFORMANCE\n")
+    w("-" * 60 + "\n")
+    for region, revenue in region_revenue.items():
+        percent = (revenue / total_revenue) * 100 if total_revenue else 0
+        w(f"{region}: Revenue={revenue:,.2f}, "
+          f"Transactions={region_count[region]}, "
+          f"Percent={percent:.2f}%\n")
+    w("\n")
+
+    w("TOP PRODUCTS\n")
+    w("-" * 60 + "\n")
+    for i, (product, revenue) in enumerate(top_products, start=1):
+        w(f"{i}. {product} | Qty={product_quantity[product]} | Revenue={revenue:,.2f}\n")
+    w("\n")
+
+    w("TOP CUSTOMERS\n")
+    w("-" * 60 + "\n")
+    for i, (cid, spent) in enumerate(top_customers, start=1):
+        w(f"{i}. {cid} | Spent={spent:,.2f} | Orders={customer_orders[cid]}\n")
+    w("\n")
+
+    w("DAILY SALES TREND\n")
+    w("-" * 60 + "\n")
+    daily_line = "{}: Revenue={:,.2f}, Transactions={}, Unique Customers={}\n".format
+    for date in sorted(daily_revenue):
+        w(daily_line(date, daily_revenue[date], daily_count[date], len(daily_customers[date])))
+    w("\n")
+
+    w("API ENRICHMENT SUMMARY\n")
+    w("-" * 60 + "\n")
+    w(f"Total Enriched Transactions: {enriched_count}\n")
+    w(f"Failed Enrichments: {len(unenriched)}\n")
+    if unenriched:
+        w("Unmatched Transaction IDs:\n")
+        buf.extend("- %s\n" % tid for tid in unenriched)
+
     # ---------- WRITE REPORT ----------
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("SALES ANALYTICS REPORT\n")
-        f.write("=" * 60 + "\n")
-        f.write(f"Generated on: {datetime.now()}\n")
-        f.write(f"Records Processed: {total_transactions}\n\n")
-
-        f.write("OVERALL SUMMARY\n")
-        f.write("-" * 60 + "\n")
-        f.write(f"Total Revenue: {total_revenue:,.2f}\n")
-        f.write(f"Total Transactions: {total_transactions}\n")
-        f.write(f"Average Order Value: {avg_order_value:,.2f}\n")
-        f.write(f"Date Range: {date_range}\n\n")
-
-        f.write("REGION-WISE PERFORMANCE\n")
-        f.write("-" * 60 + "\n")
-        for region, data in region_stats.items():
-            percent = (data["revenue"] / total_revenue) * 100 if total_revenue else 0
-            f.write(f"{region}: Revenue={data['revenue']:,.2f}, "
-                    f"Transactions={data['count']}, "
-                    f"Percent={percent:.2f}%\n")
-        f.write("\n")
-
-        f.write("TOP PRODUCTS\n")
-        f.write("-" * 60 + "\n")
-        for i, (product, data) in enumerate(top_products, start=1):
-            f.write(f"{i}. {product} | Qty={data['qty']} | Revenue={data['revenue']:,.2f}\n")
-        f.write("\n")
-
-        f.write("TOP CUSTOMERS\n")
-        f.write("-" * 60 + "\n")
-        for i, (cid, data) in enumerate(top_customers, start=1):
-            f.write(f"{i}. {cid} | Spent={data['spent']:,.2f} | Orders={data['orders']}\n")
-        f.write("\n")
-
-        f.write("DAILY SALES TREND\n")
-        f.write("-" * 60 + "\n")
-        for date in sorted(daily_stats.keys()):
-            d = daily_stats[date]
-            f.write(f"{date}: Revenue={d['revenue']:,.2f}, "
-                    f"Transactions={d['count']}, "
-                    f"Unique Customers={len(d['customers'])}\n")
-        f.write("\n")
-
-        f.write("API ENRICHMENT SUMMARY\n")
-        f.write("-" * 60 + "\n")
-        f.write(f"Total Enriched Transactions: {enriched_count}\n")
-        f.write(f"Failed Enrichments: {len(unenriched)}\n")
-        if unenriched:
-            f.write("Unmatched Transaction IDs:\n")
-            for tid in unenriched:
-                f.write(f"- {tid}\n")
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(buf))
 
     print(f"Report successfully generated at: {output_file}")
@@ -1,3 +1,6 @@
+from itertools import islice
+
+
 def read_sales_file(file_path):
     with open(file_path, "r", encoding="latin-1") as file:
         return file.readlines()
@@ -12,20 +15,15 @@ def read_sales_data(filename):
     ['T001|2024-12-01|P101|Laptop|2|45000|C001|North', ...]
     """
 
-    encodings = ["utf-8", "latin-1", "cp1252"]
-
-    for encoding in encodings:
+    # utf-8-sig also strips a UTF-8 BOM; latin-1 maps every byte, so it
+    # always succeeds
+    for encoding in ["utf-8-sig", "latin-1"]:
         try:
+            # Iterate the file lazily so only the cleaned lines are kept,
+            # never the whole file or its full decoded text
             with open(filename, "r", encoding=encoding) as file:
-                lines = file.readlines()
-
-                cleaned_lines = []
-                for line in lines[1:]:  # skip header
-                    line = line.strip()
-                    if line:
-                        cleaned_lines.append(line)
-
-                return cleaned_lines
+                # skip header and blank lines
+                return [line for line in map(str.strip, islice(file, 1, None)) if line]
 
         except UnicodeDecodeError:
             continue
@@ -33,6 +31,3 @@ def read_sales_data(filename):
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found.")
             return []
-
-    print("Error: Unable to read file due to encoding issues.")
-    return []